@@ -6,13 +6,13 @@ from .enums import PowerTypes
 from .enums import Capabilities
 
 
-@dataclass
+@dataclass(slots=True)
 class GeoLocation:
     latitude: float
     longitude: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Connector:
     id: str
     standard: ConnectorStandards
@@ -24,7 +24,7 @@ class Connector:
     last_updated: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EVSE:
     uid: str
     evse_id: str
@@ -41,7 +41,7 @@ class EVSE:
     last_updated: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     country_code: str
     party_id: str
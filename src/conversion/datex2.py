@@ -1,4 +1,9 @@
 from enum import Enum
+from src.api.enums import ParkingType
+from src.api.enums import Capabilities
+from src.api.enums import ConnectorStandards
+from src.api.enums import ConnectorFormats
+from src.api.enums import PowerTypes
 
 
 class DatexParkingType(str, Enum):
@@ -38,3 +43,11 @@ class DatexPowerTypes(str, Enum):
     AC_1_PHASE = 'mode2AC1p'
     AC_3_PHASE = 'mode3AC3p'
     DC = 'mode4DC'
+
+
+# Lookup tables from Datex values to OCPI enums, built once at import:
+OCPI_PARKING_TYPES = {d.value: ParkingType[d.name] for d in DatexParkingType}
+OCPI_CAPABILITIES = {d.value: Capabilities[d.name] for d in DatexCapabilities}
+OCPI_CONNECTOR_STANDARDS = {d.value: ConnectorStandards[d.name] for d in DatexConnectorStandards}
+OCPI_CONNECTOR_FORMATS = {d.value: ConnectorFormats[d.name] for d in DatexConnectorFormats}
+OCPI_POWER_TYPES = {d.value: PowerTypes[d.name] for d in DatexPowerTypes}
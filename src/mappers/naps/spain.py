@@ -1,48 +1,56 @@
-import json
+import orjson
 from datetime import datetime
 from datetime import timezone
+from functools import lru_cache
 from src.api.ocpi import Location
 from src.api.ocpi import EVSE
 from src.api.ocpi import Connector
 from src.api.ocpi import GeoLocation
-from src.api.ocpi import ParkingType
-from src.api.ocpi import Capabilities
-from src.api.ocpi import ConnectorStandards
-from src.api.ocpi import ConnectorFormats
-from src.api.ocpi import PowerTypes
 from src.api.container import DataContainer
-from src.conversion.datex2 import DatexCapabilities
-from src.conversion.datex2 import DatexConnectorFormats
-from src.conversion.datex2 import DatexPowerTypes
-from src.conversion.datex2 import DatexConnectorStandards
-from src.conversion.datex2 import DatexParkingType
+from src.conversion.datex2 import OCPI_PARKING_TYPES
+from src.conversion.datex2 import OCPI_CAPABILITIES
+from src.conversion.datex2 import OCPI_CONNECTOR_STANDARDS
+from src.conversion.datex2 import OCPI_CONNECTOR_FORMATS
+from src.conversion.datex2 import OCPI_POWER_TYPES
 
 
-def _enum_values(en):
-    return {v for v in en}
+def _as_list(value):
+    # xmltodict only produces a list when an element repeats:
+    return value if type(value) is list else [value]
+
+
+def _as_int(value):
+    # Datex numbers come through as decimal strings, e.g. "22.0":
+    return int(float(value)) if value is not None else None
+
+
+def _strip_label(text):
+    # Address lines are labelled, e.g. "Municipio: Toledo":
+    return text.partition(":")[2].strip()
+
+
+@lru_cache(maxsize=4096)
+def _to_utc_isoformat(timestamp):
+    # Sites in a publication share few distinct update times, so memoize:
+    return datetime.fromisoformat(timestamp).astimezone(timezone.utc).replace(tzinfo=None).isoformat()
 
 
 def parse_connector(doc) -> Connector:
-    datex_standard = DatexConnectorStandards(doc['egi:connectorType'])
-    datex_format = DatexConnectorFormats(doc['egi:connectorFormat'])
-    power_type = DatexPowerTypes(doc['egi:chargingMode'])
     return Connector(
         id="",
-        standard= ConnectorStandards[datex_standard.name],
-        format=ConnectorFormats[datex_format.name],
-        power_type=PowerTypes[power_type.name],
-        max_voltage=int(float(doc['egi:voltage'])) if 'egi:voltage' in doc else None,
-        max_amperage=int(float(doc['egi:maximumCurrent'])) if 'egi:maximumCurrent' in doc else None,
-        max_electric_power=int(float(doc['egi:maxPowerAtSocket'])) if 'egi:maxPowerAtSocket' in doc else None,
+        standard=OCPI_CONNECTOR_STANDARDS[doc['egi:connectorType']],
+        format=OCPI_CONNECTOR_FORMATS[doc['egi:connectorFormat']],
+        power_type=OCPI_POWER_TYPES[doc['egi:chargingMode']],
+        max_voltage=_as_int(doc.get('egi:voltage')),
+        max_amperage=_as_int(doc.get('egi:maximumCurrent')),
+        max_electric_power=_as_int(doc.get('egi:maxPowerAtSocket')),
         last_updated="",
     )
 
 
 def parse_evse(doc) -> EVSE:
-    connectors = doc['egi:connector']
-    if not isinstance(connectors, list):
-        connectors = [connectors]
-    
+    connectors = _as_list(doc['egi:connector'])
+
     return EVSE(
         uid=doc['@id'],
         evse_id=doc['fac:name']['com:values']['com:value']['#text'],
@@ -57,35 +65,37 @@ def parse_evse(doc) -> EVSE:
 def parse_location(doc) -> Location:
 
     operator_id = doc['fac:operator']['@id']
-    party_id = operator_id.split("*")[1] if "*" in operator_id else operator_id
+    _, sep, tail = operator_id.partition("*")
+    party_id = tail.partition("*")[0] if sep else operator_id
 
-    address = doc['fac:locationReference']['loc:_locationReferenceExtension']['loc:facilityLocation']['locx:address']['locx:addressLine'][0]['locx:text']['com:values']['com:value']['#text']
-    city = doc['fac:locationReference']['loc:_locationReferenceExtension']['loc:facilityLocation']['locx:address']['locx:addressLine'][1]['locx:text']['com:values']['com:value']['#text']
-    state = doc['fac:locationReference']['loc:_locationReferenceExtension']['loc:facilityLocation']['locx:address']['locx:addressLine'][2]['locx:text']['com:values']['com:value']['#text']
+    location_reference = doc['fac:locationReference']
+    coordinates = location_reference['loc:coordinatesForDisplay']
+    address_doc = location_reference['loc:_locationReferenceExtension']['loc:facilityLocation']['locx:address']
+    address_lines = address_doc['locx:addressLine']
 
-    evses = doc['egi:energyInfrastructureStation']['egi:refillPoint']
-    if not isinstance(evses, list):
-        evses = [evses]
+    address = address_lines[0]['locx:text']['com:values']['com:value']['#text']
+    city = address_lines[1]['locx:text']['com:values']['com:value']['#text']
+    state = address_lines[2]['locx:text']['com:values']['com:value']['#text']
 
-    datex_parking_type = DatexParkingType(doc.get('egi:typeOfSite')) if 'egi:typeOfSite' in doc and doc.get('egi:typeOfSite') in _enum_values(DatexParkingType) else None
+    evses = _as_list(doc['egi:energyInfrastructureStation']['egi:refillPoint'])
 
-    last_updated = datetime.fromisoformat(doc['fac:lastUpdated']).astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+    last_updated = _to_utc_isoformat(doc['fac:lastUpdated'])
     location = Location(
         country_code="es",
         party_id=party_id,
         id=doc["@id"],
         publish=True,
         name=doc['fac:name']['com:values']['com:value']['#text'],
-        address=":".join(address.split(":")[1:]).strip(),
-        city=":".join(city.split(":")[1:]).strip(),
-        postal_code=doc['fac:locationReference']['loc:_locationReferenceExtension']['loc:facilityLocation']['locx:address']['locx:postcode'],
-        state=":".join(state.split(":")[1:]).strip(),
+        address=_strip_label(address),
+        city=_strip_label(city),
+        postal_code=address_doc['locx:postcode'],
+        state=_strip_label(state),
         country="ESP",
         coordinates=GeoLocation(
-            latitude=float(doc['fac:locationReference']['loc:coordinatesForDisplay']['loc:latitude']),
-            longitude=float(doc['fac:locationReference']['loc:coordinatesForDisplay']['loc:longitude']),
+            latitude=float(coordinates['loc:latitude']),
+            longitude=float(coordinates['loc:longitude']),
         ),
-        parking_type=ParkingType[datex_parking_type.name] if datex_parking_type is not None else None,
+        parking_type=OCPI_PARKING_TYPES.get(doc.get('egi:typeOfSite')),
         evses=[parse_evse(pt) for pt in evses],
         
         operator=doc['fac:operator']['fac:name']['com:values']['com:value']['#text'],
@@ -94,26 +104,23 @@ def parse_location(doc) -> Location:
     )
 
     # update capabilities and update timestamp on evses
-    capabilities = doc['egi:energyInfrastructureStation'].get('egi:authenticationAndIdentificationMethods', [])
-    if isinstance(capabilities, str):
-        capabilities = [capabilities]
-    
+    capabilities = _as_list(doc['egi:energyInfrastructureStation'].get('egi:authenticationAndIdentificationMethods', []))
+    capabilities = [OCPI_CAPABILITIES[c] for c in capabilities]
+
     for evse in location.evses:
-        evse.capabilities = [
-            Capabilities[DatexCapabilities(c).name]
-            for c in capabilities
-        ]
-        evse.last_updated = location.last_updated
+        evse.capabilities = list(capabilities)
+        evse.last_updated = last_updated
         for i, connector in enumerate(evse.connectors):
-            connector.id = "*".join([evse.evse_id, str(i)])
-            connector.last_updated = evse.last_updated
+            connector.id = f"{evse.evse_id}*{i}"
+            connector.last_updated = last_updated
     
     return location
 
 
 def parse_nap_data(path_json) -> DataContainer:
     # Extract payload:
-    data_dict = json.load(open(path_json))["d2:payload"]
+    with open(path_json, "rb") as fp:
+        data_dict = orjson.loads(fp.read())["d2:payload"]
     
     # Extract stations from infrastructure table:
     egilocations = data_dict["egi:energyInfrastructureTable"]['egi:energyInfrastructureSite']
@@ -1,9 +1,18 @@
 import os
-from urllib.request import urlretrieve
+import gzip
+import shutil
+from urllib.error import ContentTooShortError
+from urllib.error import HTTPError
+from urllib.request import Request
+from urllib.request import urlopen
+
+
+CHUNK_SIZE = 1024 * 1024
+TIMEOUT = 30
 
 
 class Download:
-    
+
     def __init__(
             self,
             url: str,
@@ -11,15 +20,81 @@ class Download:
         ) -> None:
         self.url = url
         self.path = path
+        self.path_etag = path + ".etag"
+        self.path_lastmod = path + ".lastmod"
+        self.path_partial = path + ".part"
+
+    def _read_sidecar(self, path):
+        if os.path.exists(path):
+            with open(path) as fp:
+                return fp.read().strip() or None
+        return None
+
+    def _write_sidecar(self, path, value):
+        if value:
+            with open(path, "w") as fp:
+                fp.write(value)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def _validators(self):
+        headers = {}
+        etag = self._read_sidecar(self.path_etag)
+        if etag:
+            headers["If-None-Match"] = etag
+        lastmod = self._read_sidecar(self.path_lastmod)
+        if lastmod:
+            headers["If-Modified-Since"] = lastmod
+        return headers
 
     def download(self, force=False):
-        
-        if force or not os.path.exists(self.path):
-            os.makedirs(os.path.dirname(self.path), exist_ok=True)
-            urlretrieve(self.url, self.path)
-        
-        
-        
 
+        # With force, always refetch. Otherwise keep a cached copy, asking the
+        # server first if validators from an earlier download are stored:
+        headers = {"Accept-Encoding": "gzip"}
+        if not force and os.path.exists(self.path):
+            validators = self._validators()
+            if not validators:
+                return self.path
+            headers.update(validators)
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        request = Request(self.url, headers=headers)
+        try:
+            response = urlopen(request, timeout=TIMEOUT)
+        except HTTPError as e:
+            # Upstream file unchanged, keep the cached copy:
+            if e.code == 304:
+                return self.path
+            raise
+
+        with response:
+            body = response
+            encoding = response.headers.get("Content-Encoding")
+            if encoding == "gzip":
+                body = gzip.GzipFile(fileobj=response)
+            expected = response.headers.get("Content-Length")
 
+            # Write aside and swap in, so an interrupted transfer never
+            # leaves a truncated file that looks like a valid cache:
+            try:
+                with open(self.path_partial, "wb") as fp:
+                    shutil.copyfileobj(body, fp, CHUNK_SIZE)
+                    size = fp.tell()
+                # A dropped connection just ends the body early, so check
+                # it against the declared length (gzip checks itself):
+                if expected is not None and not encoding and size < int(expected):
+                    raise ContentTooShortError(
+                        f"retrieval incomplete: got only {size} out of {expected} bytes",
+                        (self.path_partial, response.headers),
+                    )
+                os.replace(self.path_partial, self.path)
+            finally:
+                if os.path.exists(self.path_partial):
+                    os.remove(self.path_partial)
+            # Only a complete copy gets validators, so it alone is revalidated:
+            self._write_sidecar(self.path_etag, response.headers.get("ETag"))
+            self._write_sidecar(self.path_lastmod, response.headers.get("Last-Modified"))
 
+        return self.path
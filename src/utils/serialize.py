@@ -1,8 +1,23 @@
 import json
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from dataclasses import fields
+from dataclasses import is_dataclass
+
+
+@lru_cache(maxsize=None)
+def _converter(cls):
+    # Resolve how to serialize each type once, not on every object:
+    if issubclass(cls, Enum):
+        return attrgetter("name")
+    if is_dataclass(cls):
+        # Slotted dataclasses have no __dict__:
+        names = tuple(f.name for f in fields(cls))
+        return lambda o: {name: getattr(o, name) for name in names}
+    # vars() raises TypeError for objects without a __dict__, as json expects:
+    return vars
 
 
 def default_serializer(o):
-    if isinstance(o, Enum):
-        return o.name
-    return o.__dict__
+    return _converter(type(o))(o)
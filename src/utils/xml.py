@@ -1,8 +1,21 @@
 import os
-import json
+import orjson
 import xmltodict
 
 
+def _interning_postprocessor():
+    # Tag names and short enum-like values repeat for every record, so share
+    # one string object per distinct value instead of one per occurrence:
+    strings = {}
+
+    def postprocessor(path, key, value):
+        if isinstance(value, str) and len(value) < 32:
+            value = strings.setdefault(value, value)
+        return strings.setdefault(key, key), value
+
+    return postprocessor
+
+
 def xml_to_json(input_path, force_if_exists=False):
     
     if not input_path.endswith(".xml"):
@@ -10,11 +23,19 @@ def xml_to_json(input_path, force_if_exists=False):
 
     path_js = input_path.replace(".xml", ".json")
 
-    if force_if_exists or not os.path.exists(path_js):
-        with open(input_path) as xml_file:
-            data_dict = xmltodict.parse(xml_file.read())
+    # Reuse a previous conversion unless the XML changed since it was made:
+    is_fresh = os.path.exists(path_js) and os.path.getmtime(path_js) >= os.path.getmtime(input_path)
+
+    if force_if_exists or not is_fresh:
+        # Let expat pull the file in chunks instead of reading it whole:
+        with open(input_path, "rb") as xml_file:
+            data_dict = xmltodict.parse(xml_file, postprocessor=_interning_postprocessor())
 
-        with open(path_js, "w") as json_file:
-            json.dump(data_dict, json_file)
+        # Write aside and swap in, so an interrupted run never leaves a
+        # truncated JSON behind that would pass as an up-to-date conversion:
+        path_partial = path_js + ".part"
+        with open(path_partial, "wb") as json_file:
+            json_file.write(orjson.dumps(data_dict))
+        os.replace(path_partial, path_js)
             
     return path_js
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from urllib.error import ContentTooShortError
+
+from src.utils.download import Download
+
+
+BODY = b"<d2:payload/>" * 1000
+
+
+class TruncatingHandler(BaseHTTPRequestHandler):
+
+    # Declares the full length and sends all of it, unless truncate is set:
+    truncate = False
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.send_header("ETag", '"new"')
+        self.end_headers()
+        self.wfile.write(BODY[:1000] if self.truncate else BODY)
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownload(unittest.TestCase):
+
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), TruncatingHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/electrolineras.xml"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "raw", "electrolineras.xml")
+        TruncatingHandler.truncate = False
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_complete(self):
+        Download(url=self.url, path=self.path).download()
+        with open(self.path, "rb") as fp:
+            self.assertEqual(fp.read(), BODY)
+        with open(self.path + ".etag") as fp:
+            self.assertEqual(fp.read(), '"new"')
+
+    def test_truncated(self):
+        TruncatingHandler.truncate = True
+        with self.assertRaises(ContentTooShortError):
+            Download(url=self.url, path=self.path).download()
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), [])
+
+    def test_truncated_keeps_cache(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as fp:
+            fp.write(b"cached")
+        with open(self.path + ".etag", "w") as fp:
+            fp.write('"old"')
+
+        TruncatingHandler.truncate = True
+        with self.assertRaises(ContentTooShortError):
+            Download(url=self.url, path=self.path).download(force=True)
+
+        # Neither the cached copy nor its validators were touched:
+        with open(self.path, "rb") as fp:
+            self.assertEqual(fp.read(), b"cached")
+        with open(self.path + ".etag") as fp:
+            self.assertEqual(fp.read(), '"old"')
+        self.assertFalse(os.path.exists(self.path + ".part"))
+
+
+if __name__ == "__main__":
+    unittest.main()